@@ -1,9 +1,5 @@
 import argparse
-from src.uploader import main as uploader_main
-from src.scheduler import main as scheduler_main
-from src.caption_generator import generate_captions
 import logging
-import sys
 logger = logging.getLogger(__name__)
 
 def parse_args():
@@ -43,21 +39,8 @@ def parse_args():
                             help='Path to image file or directory')
     caption_parser.add_argument('-o', '--output', type=str,
                             help='Output CSV file path (optional)')
-    
-    # If no arguments at all, show main help
-    if len(sys.argv) == 1:
-        parser.print_help()
-        sys.exit(1)
-    
-    # If only command is provided, show command-specific help
-    if len(sys.argv) == 2:
-        if sys.argv[1] == 'insta-upload':
-            upload_parser.print_help()
-        elif sys.argv[1] == 'scheduler':
-            scheduler_parser.print_help()
-        elif sys.argv[1] == 'generate-captions':
-            caption_parser.print_help()
-        sys.exit(1)
+    caption_parser.add_argument('--num-beams', type=int, default=1,
+                            help='Beam count for caption decoding (1 = greedy, fastest)')
     
     return parser.parse_args()
 
@@ -72,22 +55,32 @@ def main(args=None):
         args = parse_args()
     
     if args.command == 'generate-captions':
+        # Import here so other commands don't pay the torch/transformers cost
+        from src.caption_generator import generate_captions
         return generate_captions(
             input_path=args.input,
-            output_file=args.output if hasattr(args, 'output') else None
+            output_file=args.output if hasattr(args, 'output') else None,
+            num_beams=args.num_beams
         )
     elif args.command == 'scheduler':
         # If extra_caption provided in command line, update config
         if hasattr(args, 'extra_caption') and args.extra_caption:
             import yaml
+            # Prefer the libyaml C loader/dumper when available
+            try:
+                from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+            except ImportError:
+                from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
             with open(args.config) as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=_Loader)
             config['extra_caption'] = args.extra_caption
             with open(args.config, 'w') as f:
-                yaml.dump(config, f)
+                yaml.dump(config, f, Dumper=_Dumper)
         
+        from src.scheduler import main as scheduler_main
         return scheduler_main(args.config, args.media_list, not args.no_headless, args.force)
     else:  # insta-upload
+        from src.uploader import main as uploader_main
         # Create a new Namespace with uploader arguments
         upload_args = argparse.Namespace(
             file=args.file,
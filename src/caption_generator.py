@@ -1,60 +1,242 @@
-from PIL import Image
 from pathlib import Path
+import functools
 import logging
 import csv
 import sys
-from typing import Iterator, Tuple
+from typing import Iterator, List, Tuple
 import argparse
-import tempfile
+import hashlib
+import sqlite3
+import subprocess
 import os
 
 logger = logging.getLogger(__name__)
 
+# Media types the generator knows how to caption, shared by
+# process_directory and generate_caption
+IMAGE_EXTS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.bmp'})
+VIDEO_EXTS = frozenset({'.mp4', '.mov', '.avi', '.mkv', '.webm'})
+
+# Content-addressed caption cache: repeated runs over the same media
+# (e.g. a resubmitted scheduler media list) skip inference entirely
+_CAPTION_CACHE_PATH = Path.home() / '.cache' / 'insta-scheduler' / 'captions.sqlite'
+_caption_cache_conn = None
+
+def _file_sha256(file_path: str) -> str:
+    """SHA-256 of a file's contents"""
+    with open(file_path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+def _get_caption_cache():
+    """Open (once) the sqlite cache keyed by content hash and model"""
+    global _caption_cache_conn
+    if _caption_cache_conn is None:
+        _CAPTION_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _caption_cache_conn = sqlite3.connect(_CAPTION_CACHE_PATH)
+        _caption_cache_conn.execute(
+            "CREATE TABLE IF NOT EXISTS captions "
+            "(sha256 TEXT NOT NULL, model TEXT NOT NULL, caption TEXT, mtime REAL, "
+            "PRIMARY KEY (sha256, model))"
+        )
+    return _caption_cache_conn
+
+def _cached_caption(sha256: str, model: str):
+    """Return the cached caption for (hash, model), or None"""
+    try:
+        row = _get_caption_cache().execute(
+            "SELECT caption FROM captions WHERE sha256 = ? AND model = ?",
+            (sha256, model)
+        ).fetchone()
+        return row[0] if row else None
+    except Exception as e:
+        logger.debug(f"Caption cache lookup failed: {e}")
+        return None
+
+def _store_caption(sha256: str, model: str, caption: str, mtime: float):
+    """Record a generated caption in the cache (best effort)"""
+    try:
+        conn = _get_caption_cache()
+        conn.execute(
+            "INSERT OR REPLACE INTO captions (sha256, model, caption, mtime) VALUES (?, ?, ?, ?)",
+            (sha256, model, caption, mtime)
+        )
+        conn.commit()
+    except Exception as e:
+        logger.debug(f"Caption cache store failed: {e}")
+
+def _open_rgb(image_path: str) -> "Image.Image":
+    """
+    Open an image as RGB, letting libjpeg decode at reduced scale.
+
+    BLIP resizes everything to 384x384, so draft() asks the JPEG decoder
+    for the nearest DCT scale >= that size instead of decoding the full
+    resolution (a no-op for non-JPEG formats).
+    """
+    from PIL import Image
+    image = Image.open(image_path)
+    image.draft('RGB', (384, 384))
+    return image.convert('RGB')
+
+def _apply_model_cache_env():
+    """Point HuggingFace at a local cache dir when INSTA_SCHEDULER_MODEL_CACHE is set"""
+    cache_dir = os.environ.get('INSTA_SCHEDULER_MODEL_CACHE')
+    if cache_dir:
+        os.environ.setdefault('HF_HOME', cache_dir)
+        os.environ.setdefault('TRANSFORMERS_CACHE', cache_dir)
+
+@functools.lru_cache(maxsize=2)
+def _load_blip(device_str: str, load_in_4bit: bool):
+    """
+    Load and cache the BLIP processor/model for a device.
+
+    Module-level cache so every CaptionGenerator instance (the scheduler
+    creates one per upload) shares the same loaded weights.
+
+    Returns:
+        Tuple of (processor, model, dtype)
+    """
+    try:
+        logger.info("Loading BLIP model and processor")
+        _apply_model_cache_env()
+        import torch
+        from transformers import BlipProcessor, BlipForConditionalGeneration
+        device = torch.device(device_str)
+        processor = BlipProcessor.from_pretrained("Salesforce/blip-image-captioning-base")
+
+        if load_in_4bit and device.type == 'cuda':
+            # Quantized load: bitsandbytes places weights on device itself
+            from transformers import BitsAndBytesConfig
+            quant_config = BitsAndBytesConfig(
+                load_in_4bit=True,
+                bnb_4bit_compute_dtype=torch.float16,
+                bnb_4bit_quant_type="nf4"
+            )
+            model = BlipForConditionalGeneration.from_pretrained(
+                "Salesforce/blip-image-captioning-base",
+                quantization_config=quant_config
+            )
+            model = model.eval()
+            dtype = torch.float16
+        else:
+            model = BlipForConditionalGeneration.from_pretrained("Salesforce/blip-image-captioning-base")
+
+            # Move model to device and optimize
+            model = model.to(device)
+            model = model.eval()
+
+            # Run in half precision on CUDA: doubles tensor-core
+            # throughput and halves VRAM with negligible quality loss
+            if device.type == 'cuda':
+                dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+                model = model.to(dtype)
+            else:
+                dtype = torch.float32
+
+        # Compile when supported (PyTorch 2.0+): trims per-step Python and
+        # kernel-launch overhead, which dominates greedy decoding
+        if hasattr(torch, 'compile'):
+            try:
+                model = torch.compile(model, mode="reduce-overhead", fullgraph=False)
+            except Exception as e:
+                logger.warning(f"torch.compile failed, running eager: {e}")
+
+        logger.info("BLIP model loaded successfully")
+        return processor, model, dtype
+    except Exception as e:
+        logger.error(f"Failed to load BLIP model: {e}")
+        raise
+
+@functools.lru_cache(maxsize=1)
+def _load_whisper():
+    """Load and cache the Whisper model (shared across generator instances)"""
+    try:
+        logger.info("Loading Whisper model")
+        _apply_model_cache_env()
+        import torch
+        from faster_whisper import WhisperModel
+        # CTranslate2 backend: same accuracy as openai-whisper at ~4x the
+        # speed and half the memory thanks to INT8 quantized kernels
+        if torch.cuda.is_available():
+            whisper_model = WhisperModel("base", device="cuda", compute_type="int8_float16")
+        else:
+            whisper_model = WhisperModel("base", device="cpu", compute_type="int8")
+        logger.info("Whisper model loaded successfully")
+        return whisper_model
+    except Exception as e:
+        logger.error(f"Failed to load Whisper model: {e}")
+        raise
+
+class _ImagePreprocessDataset:
+    """
+    Dataset that opens and preprocesses one image per __getitem__.
+
+    Used with a DataLoader so decode/tensorization runs in worker
+    processes. Open/decode failures are returned as error strings rather
+    than raised, so the main loop can report them per file.
+    """
+    def __init__(self, image_paths: List[str], processor):
+        self.image_paths = image_paths
+        self.processor = processor
+
+    def __len__(self):
+        return len(self.image_paths)
+
+    def __getitem__(self, idx):
+        image_path = self.image_paths[idx]
+        try:
+            image = _open_rgb(image_path)
+            pixel_values = self.processor(images=image, return_tensors="pt")['pixel_values'][0]
+            return image_path, pixel_values, None
+        except Exception as e:
+            return image_path, None, str(e)
+
+def _collate_preprocessed(batch):
+    """Stack successfully preprocessed tensors; pass failures through"""
+    import torch
+    errors = [(path, error) for path, tensor, error in batch if tensor is None]
+    loaded = [(path, tensor) for path, tensor, error in batch if tensor is not None]
+    if not loaded:
+        return [], None, errors
+    paths = [path for path, _ in loaded]
+    pixel_values = torch.stack([tensor for _, tensor in loaded])
+    return paths, pixel_values, errors
+
 class CaptionGenerator:
-    def __init__(self):
-        """Initialize basic attributes"""
+    def __init__(self, batch_size: int = 8, load_in_4bit: bool = False, num_beams: int = 1):
+        """
+        Initialize basic attributes
+
+        Args:
+            batch_size: Number of images to caption per model forward pass
+            load_in_4bit: Load BLIP weights 4-bit quantized via bitsandbytes
+                (CUDA only; cuts VRAM and memory bandwidth roughly 4x)
+            num_beams: Beam count for BLIP decoding (1 = greedy, the
+                fastest; higher trades speed for marginal quality)
+        """
         self.processor = None
         self.model = None
         self.whisper_model = None
         self.device = None
+        self.dtype = None
+        self.batch_size = batch_size
+        self.load_in_4bit = load_in_4bit
+        self.num_beams = num_beams
 
     def _init_image_model(self):
-        """Lazy initialization of BLIP model"""
+        """Lazy initialization of BLIP model (served from the module cache)"""
         if self.model is None:
-            try:
-                logger.info("Loading BLIP model and processor")
-                from transformers import BlipProcessor, BlipForConditionalGeneration
-                self.processor = BlipProcessor.from_pretrained("Salesforce/blip-image-captioning-base")
-                self.model = BlipForConditionalGeneration.from_pretrained("Salesforce/blip-image-captioning-base")
-                
-                # Set up device
-                self._setup_device()
-                
-                # Move model to device and optimize
-                self.model = self.model.to(self.device)
-                self.model = self.model.eval()
-                
-                logger.info("BLIP model loaded successfully")
-            except Exception as e:
-                logger.error(f"Failed to load BLIP model: {e}")
-                raise
+            self._setup_device()
+            self.processor, self.model, self.dtype = _load_blip(str(self.device), self.load_in_4bit)
 
     def _init_video_model(self):
-        """Lazy initialization of Whisper model"""
+        """Lazy initialization of Whisper model (served from the module cache)"""
         if self.whisper_model is None:
-            try:
-                logger.info("Loading Whisper model")
-                import whisper
-                import torch
-                import warnings
-                # Suppress the FutureWarning about weights_only
-                with warnings.catch_warnings():
-                    warnings.filterwarnings("ignore", category=FutureWarning)
-                    self.whisper_model = whisper.load_model("base")
-                logger.info("Whisper model loaded successfully")
-            except Exception as e:
-                logger.error(f"Failed to load Whisper model: {e}")
-                raise
+            self.whisper_model = _load_whisper()
 
     def _setup_device(self):
         """Set up the device (CPU/GPU)"""
@@ -81,56 +263,154 @@ class CaptionGenerator:
         Yields:
             Tuple[str, str]: (file_path, caption) for each file
         """
-        path = Path(directory_path)
-        if not path.is_dir():
+        if not os.path.isdir(directory_path):
             raise NotADirectoryError(f"Not a directory: {directory_path}")
-            
-        # Common media extensions
-        image_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.bmp'}
-        video_extensions = {'.mp4', '.mov', '.avi', '.mkv', '.webm'}
-        
-        # Process each file
-        for file_path in path.iterdir():
-            ext = file_path.suffix.lower()
+
+        # Collect files by type so images can be captioned in batches;
+        # scandir avoids a Path object allocation per entry
+        image_paths = []
+        video_paths = []
+        with os.scandir(directory_path) as entries:
+            for entry in entries:
+                ext = os.path.splitext(entry.name)[1].lower()
+                if ext in IMAGE_EXTS:
+                    image_paths.append(entry.path)
+                elif ext in VIDEO_EXTS:
+                    video_paths.append(entry.path)
+
+        # Caption images in batches, with decode/preprocess running in
+        # worker processes so the CPU side overlaps GPU generation
+        if image_paths:
+            yield from self._caption_images_pipelined(image_paths)
+
+        # Videos: audio extraction for upcoming files runs in a small
+        # thread pool while Whisper transcribes the current one
+        if video_paths:
+            yield from self._caption_videos_pipelined(video_paths)
+
+    def _caption_videos_pipelined(self, video_paths: List[str], prefetch: int = 3) -> Iterator[Tuple[str, str]]:
+        """
+        Transcribe videos while prefetching audio for the next ones.
+
+        ffmpeg extraction is CPU/IO-bound and independent per file, so a
+        bounded prefetch queue keeps the transcriber fed without holding
+        more than a few decoded tracks in memory.
+        """
+        from collections import deque
+        from concurrent.futures import ThreadPoolExecutor
+
+        self._init_video_model()
+        remaining = iter(video_paths)
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            pending = deque()
+            for video_path in video_paths[:prefetch]:
+                next(remaining)
+                pending.append((video_path, pool.submit(self._extract_audio, video_path)))
+
+            while pending:
+                video_path, future = pending.popleft()
+                queued = next(remaining, None)
+                if queued is not None:
+                    pending.append((queued, pool.submit(self._extract_audio, queued)))
+                try:
+                    yield video_path, self._caption_from_audio(future.result(), video_path)
+                except Exception as e:
+                    logger.error(f"Failed to process {video_path}: {e}")
+                    yield video_path, f"ERROR: {str(e)}"
+
+    def _caption_images_pipelined(self, image_paths: List[str]) -> Iterator[Tuple[str, str]]:
+        """
+        Caption images with a DataLoader producer/consumer pipeline.
+
+        Worker threads handle file reads, PIL decoding and processor
+        tensorization while the main thread only moves batches to the
+        device and runs generate, so CPU preprocessing overlaps GPU
+        compute. Images that fail to open are reported individually so
+        one bad file doesn't fail the whole batch.
+        """
+        # Initialize BLIP model if not already done
+        self._init_image_model()
+        import torch
+        from torch.utils.data import DataLoader
+
+        dataset = _ImagePreprocessDataset(image_paths, self.processor)
+        loader = DataLoader(
+            dataset,
+            batch_size=self.batch_size,
+            num_workers=max(1, (os.cpu_count() or 2) // 2),
+            pin_memory=self.device.type == 'cuda',
+            collate_fn=_collate_preprocessed
+        )
+
+        for paths, pixel_values, errors in loader:
+            for image_path, error in errors:
+                logger.error(f"Failed to process {image_path}: {error}")
+                yield image_path, f"ERROR: {error}"
+
+            if pixel_values is None:
+                continue
+
             try:
-                if ext in image_extensions:
-                    caption = self.generate_image_caption(str(file_path))
-                elif ext in video_extensions:
-                    caption = self.generate_video_caption(str(file_path))
-                else:
-                    continue  # Skip unsupported files
-                yield str(file_path), caption
+                pixel_values = pixel_values.to(self.device, non_blocking=True)
+                captions = self._generate_from_pixel_values(pixel_values)
             except Exception as e:
-                logger.error(f"Failed to process {file_path}: {e}")
-                yield str(file_path), f"ERROR: {str(e)}"
+                logger.error(f"Failed to caption image batch: {e}")
+                for image_path in paths:
+                    yield image_path, f"ERROR: {str(e)}"
+                continue
+
+            yield from zip(paths, captions)
+
+    def _generate_from_pixel_values(self, pixel_values, max_length: int = 30) -> List[str]:
+        """Run BLIP generate on a device-resident pixel_values batch"""
+        import torch
+        pixel_values = pixel_values.to(self.dtype)
+
+        # inference_mode is strictly cheaper than no_grad: it also skips
+        # version-counter bumps and view tracking in the autograd engine
+        with torch.inference_mode():
+            outputs = self.model.generate(
+                pixel_values=pixel_values,
+                max_length=max_length,
+                num_beams=self.num_beams,
+                do_sample=False,
+                early_stopping=self.num_beams > 1,
+                repetition_penalty=1.5
+            )
+
+        return self.processor.batch_decode(outputs, skip_special_tokens=True)
+
+    def generate_image_captions(self, images: List["Image.Image"], max_length: int = 30) -> List[str]:
+        """
+        Generate captions for a batch of already-loaded images.
+
+        Args:
+            images: List of PIL images to caption
+            max_length: Maximum length of each generated caption
+
+        Returns:
+            List[str]: One caption per input image, in order
+        """
+        # Initialize BLIP model if not already done
+        self._init_image_model()
+
+        inputs = self.processor(images=images, return_tensors="pt", padding=True)
+        pixel_values = inputs['pixel_values'].to(self.device)
+        return self._generate_from_pixel_values(pixel_values, max_length)
 
     def generate_image_caption(self, image_path: str, max_length: int = 30) -> str:
-        """Generate caption for an image"""
+        """Generate caption for an image (batch-of-one wrapper)"""
         try:
-            # Initialize BLIP model if not already done
-            self._init_image_model()
-            
-            path = Path(image_path)
-            if not path.exists():
-                raise FileNotFoundError(f"Image not found: {image_path}")
-            
-            image = Image.open(image_path).convert('RGB')
-            inputs = self.processor(image, return_tensors="pt")
-            inputs = {k: v.to(self.device) for k, v in inputs.items()}
-            
-            with torch.no_grad():
-                outputs = self.model.generate(
-                    **inputs,
-                    max_length=max_length,
-                    num_beams=5,
-                    temperature=1.0,
-                    repetition_penalty=1.5
-                )
-            
-            caption = self.processor.decode(outputs[0], skip_special_tokens=True)
+            # No separate exists() check: let the open raise, saving a
+            # stat per file and avoiding the check/open race
+            try:
+                image = _open_rgb(image_path)
+            except FileNotFoundError as e:
+                raise FileNotFoundError(f"Image not found: {image_path}") from e
+            caption = self.generate_image_captions([image], max_length)[0]
             logger.debug(f"Generated image caption for {image_path}: {caption}")
             return caption
-            
+
         except Exception as e:
             logger.error(f"Failed to generate image caption: {e}")
             raise
@@ -140,94 +420,168 @@ class CaptionGenerator:
         try:
             # Initialize Whisper model if not already done
             self._init_video_model()
-            
-            path = Path(video_path)
-            if not path.exists():
-                raise FileNotFoundError(f"Video not found: {video_path}")
-
-            # Create a temporary directory for audio extraction
-            with tempfile.TemporaryDirectory() as temp_dir:
-                audio_path = os.path.join(temp_dir, "audio.wav")
-                
-                # Extract audio from video
-                logger.debug(f"Extracting audio from {video_path}")
-                from moviepy.editor import VideoFileClip
-                video = VideoFileClip(video_path)
-                video.audio.write_audiofile(audio_path, logger=None)
-                video.close()
-                
-                # Transcribe audio
-                logger.debug("Transcribing audio")
-                result = self.whisper_model.transcribe(audio_path)
-                text = result["text"].strip()
-                
-                # Get first 10 words
-                words = text.split()[:10]
-                caption = " ".join(words)
-                
-                logger.debug(f"Generated video caption for {video_path}: {caption}")
-                return caption
+
+            # Pipe 16 kHz mono PCM straight from ffmpeg into a numpy
+            # buffer; Whisper accepts the array directly, so no temp WAV
+            # is written or re-read. The missing-file case is detected
+            # from the ffmpeg failure rather than a separate stat.
+            try:
+                audio = self._extract_audio(video_path)
+            except subprocess.CalledProcessError as e:
+                if not os.path.exists(video_path):
+                    raise FileNotFoundError(f"Video not found: {video_path}") from e
+                raise
+            return self._caption_from_audio(audio, video_path)
 
         except Exception as e:
             logger.error(f"Failed to generate video caption: {e}")
             raise
 
+    def _caption_from_audio(self, audio, video_path: str) -> str:
+        """Transcribe an already-extracted audio track into a caption"""
+        self._init_video_model()
+
+        logger.debug("Transcribing audio")
+        segments, _info = self.whisper_model.transcribe(audio, beam_size=1)
+        text = " ".join(segment.text.strip() for segment in segments).strip()
+
+        # Get first 10 words
+        words = text.split()[:10]
+        caption = " ".join(words)
+
+        logger.debug(f"Generated video caption for {video_path}: {caption}")
+        return caption
+
+    @staticmethod
+    def _extract_audio(video_path: str):
+        """Decode a video's audio track to a 16 kHz mono float32 array"""
+        import numpy as np
+        logger.debug(f"Extracting audio from {video_path}")
+        proc = subprocess.run(
+            ["ffmpeg", "-i", video_path,
+             "-f", "s16le", "-acodec", "pcm_s16le", "-ac", "1", "-ar", "16000", "-"],
+            check=True, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+        )
+        return np.frombuffer(proc.stdout, np.int16).astype(np.float32) / 32768.0
+
     def generate_caption(self, file_path: str, max_length: int = 30) -> str:
         """Generate caption for a media file (image or video)"""
-        ext = Path(file_path).suffix.lower()
-        video_extensions = {'.mp4', '.mov', '.avi', '.mkv', '.webm'}
-        
-        if ext in video_extensions:
-            return self.generate_video_caption(file_path)
+        ext = os.path.splitext(file_path)[1].lower()
+        model_id = "faster-whisper-base" if ext in VIDEO_EXTS else "Salesforce/blip-image-captioning-base"
+
+        # Serve identical content from the cache instead of re-running the model
+        sha256 = None
+        try:
+            sha256 = _file_sha256(file_path)
+        except OSError as e:
+            logger.debug(f"Could not hash {file_path} for caption cache: {e}")
+        if sha256 is not None:
+            cached = _cached_caption(sha256, model_id)
+            if cached is not None:
+                logger.debug(f"Caption cache hit for {file_path}")
+                return cached
+
+        if ext in VIDEO_EXTS:
+            caption = self.generate_video_caption(file_path)
         else:
-            return self.generate_image_caption(file_path, max_length)
+            caption = self.generate_image_caption(file_path, max_length)
+
+        if sha256 is not None:
+            _store_caption(sha256, model_id, caption, os.path.getmtime(file_path))
+        return caption
+
+def _count_media_files(directory_path: str) -> int:
+    """Count supported media files in a directory"""
+    count = 0
+    with os.scandir(directory_path) as entries:
+        for entry in entries:
+            ext = os.path.splitext(entry.name)[1].lower()
+            if ext in IMAGE_EXTS or ext in VIDEO_EXTS:
+                count += 1
+    return count
 
-def generate_captions(input_path: str, output_file: str = None) -> int:
+def _preallocate_csv(csv_file, expected_rows: int, avg_row_bytes: int = 120) -> bool:
+    """
+    Best-effort preallocation of the output CSV's expected size.
+
+    Avoids repeated extent allocation as the file grows on ext4/XFS;
+    silently skipped on platforms without posix_fallocate.
+    """
+    if expected_rows <= 0 or not hasattr(os, 'posix_fallocate'):
+        return False
+    try:
+        os.posix_fallocate(csv_file.fileno(), 0, expected_rows * avg_row_bytes)
+        return True
+    except OSError:
+        return False
+
+def generate_captions(input_path: str, output_file: str = None, num_beams: int = 1) -> int:
     """
     Generate captions for images and optionally save to CSV
     
     Args:
         input_path: Path to image file or directory
         output_file: Optional path to output CSV file. If None, only print to console.
+        num_beams: Beam count for BLIP decoding (default 1, greedy)
         
     Returns:
         int: 0 for success, 1 for error
     """
     try:
-        generator = CaptionGenerator()
+        generator = CaptionGenerator(num_beams=num_beams)
         path = Path(input_path)
         
         # Initialize CSV writer if output file is specified
         csv_writer = None
         csv_file = None
+        preallocated = False
         if output_file:
-            csv_file = open(output_file, 'w', newline='')
+            # Large buffer so per-row writes don't each hit the kernel
+            csv_file = open(output_file, 'w', newline='', buffering=1 << 20)
             csv_writer = csv.writer(csv_file)
             csv_writer.writerow(['file_path', 'caption'])
             logger.info(f"Writing captions to: {output_file}")
-            
+            if path.is_dir():
+                preallocated = _preallocate_csv(csv_file, _count_media_files(input_path))
+
+        # Console output goes through a csv.writer too, so captions
+        # containing commas or quotes are quoted instead of corrupted
+        stdout_writer = csv.writer(sys.stdout)
+
+        # Buffer rows and flush per caption batch rather than per file
+        pending_rows = []
+
+        def flush_rows():
+            if not pending_rows:
+                return
+            stdout_writer.writerows(pending_rows)
+            if csv_writer:
+                csv_writer.writerows(pending_rows)
+            pending_rows.clear()
+
         try:
             if path.is_dir():
+                # Pre-warm BLIP so directory iteration doesn't stall on the
+                # first batch waiting for the model load
+                generator._init_image_model()
                 for file_path, caption in generator.process_directory(input_path):
-                    result = f"{file_path},{caption}"
-                    print(result)
-                    if csv_writer:
-                        csv_writer.writerow([file_path, caption])
+                    pending_rows.append((file_path, caption))
+                    if len(pending_rows) >= generator.batch_size:
+                        flush_rows()
+                flush_rows()
             else:
                 try:
                     caption = generator.generate_caption(input_path)
-                    result = f"{input_path},{caption}"
-                    print(result)
-                    if csv_writer:
-                        csv_writer.writerow([input_path, caption])
+                    pending_rows.append((input_path, caption))
                 except Exception as e:
-                    error_msg = f"ERROR: {str(e)}"
-                    result = f"{input_path},{error_msg}"
-                    print(result)
-                    if csv_writer:
-                        csv_writer.writerow([input_path, error_msg])
+                    pending_rows.append((input_path, f"ERROR: {str(e)}"))
+                flush_rows()
         finally:
             if csv_file:
+                if preallocated:
+                    # Trim any unused preallocated space
+                    csv_file.flush()
+                    csv_file.truncate()
                 csv_file.close()
                 logger.info(f"Captions saved to: {output_file}")
         
@@ -246,9 +600,11 @@ def main():
                        help='Maximum length of generated caption')
     parser.add_argument('-o', '--output', type=str,
                        help='Output CSV file path (optional)')
+    parser.add_argument('--num-beams', type=int, default=1,
+                       help='Beam count for caption decoding (1 = greedy, fastest)')
     args = parser.parse_args()
     
-    return generate_captions(args.path, args.output)
+    return generate_captions(args.path, args.output, num_beams=args.num_beams)
 
 if __name__ == "__main__":
     exit(main()) 
\ No newline at end of file
@@ -8,22 +8,26 @@ class InstagramConfig:
     password: str
     
     @classmethod
-    def from_json(cls, config_path: Path):
+    def from_json(cls, config_source):
         """
         Create config from JSON file, with environment variables taking precedence
         
         Args:
-            config_path: Path to config JSON file
+            config_source: Path to config JSON file, or an
+                already-parsed dict (lets callers that have read the
+                env config once avoid a second open+parse)
             
         Returns:
             InstagramConfig: Configuration instance
         """
-        if not config_path.exists():
-            raise FileNotFoundError(f"Config file not found: {config_path}")
-            
-        import json
-        with open(config_path) as f:
-            config = json.load(f)
+        if isinstance(config_source, dict):
+            config = config_source
+        else:
+            if not config_source.exists():
+                raise FileNotFoundError(f"Config file not found: {config_source}")
+
+            from src.utils import load_json_file
+            config = load_json_file(config_source)
             
         return cls(
             # Environment variables take precedence over config file
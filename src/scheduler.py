@@ -1,17 +1,31 @@
-import pandas as pd
+import copy
+import csv
+import io
+import os
+import pickle
 import yaml
 from datetime import datetime, timedelta
-import time
 import subprocess
 from pathlib import Path
 import logging
+import threading
 from .window_tracker import WindowTracker
 import signal
 import atexit
 from croniter import croniter, CroniterNotAlphaError, CroniterBadCronError
 
+# Prefer the libyaml C loader when available (~10x faster parse)
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 logger = logging.getLogger(__name__)
 
+# In-process parse cache keyed by (path, mtime_ns, size); complements
+# the pickle sidecar, which covers restarts
+_YAML_CACHE = {}
+
 class SchedulerConfigError(Exception):
     """Raised when there are issues with scheduler configuration"""
     pass
@@ -24,24 +38,42 @@ class MediaStatus:
     @classmethod
     def is_pending(cls, status):
         """Check if a status value represents a pending state"""
-        return status != cls.ERROR and status != cls.PROCESSED
+        return status not in _TERMINAL_STATUSES
+
+# croniter's get_prev skips a tick when anchored exactly on it; probing
+# one microsecond later makes (get_prev, get_next) bracket from_time
+_TICK_EPSILON = timedelta(microseconds=1)
+
+# Statuses that mean a row is done; single hash lookup instead of
+# chained string comparisons in the per-row pending check
+_TERMINAL_STATUSES = frozenset({MediaStatus.ERROR, MediaStatus.PROCESSED})
 
 class MediaScheduler:
     def __init__(self, config_path=None):
         """Initialize scheduler with config file path"""
         self.config_path = config_path
         self.config = None
-        self.media_df = None
+        self.media_rows = None
+        self._media_fields = None
+        self._media_list_path = None
+        self._media_mtime = None
+        self._status_log = None
+        self._path_to_idx = None
         self.schedule_times = []
         self.schedule_config = {}
         self.current_window = None
+        self._current_window_key = None
+        self._window_exhausted_for = None
         self.tasks_in_window = 0
         self.extra_caption = None
         self.window_tracker = WindowTracker()
         self.has_lock = False
+        self._driver = None  # Chrome driver reused within a window
         self.headless = True
         self.force = False  # Add force flag
         self.cron_iters = []  # Store cron iterators
+        self._cron_cache = []  # Per-schedule (prev, next) fire-time pairs
+        self._shutdown_event = threading.Event()
         
         # Register cleanup handlers
         atexit.register(self._cleanup)
@@ -52,22 +84,154 @@ class MediaScheduler:
         """Cleanup resources"""
         if self.has_lock:  # Only cleanup if we created the lock
             logger.info("Cleaning up scheduler resources")
+            self._close_window_driver()
+            self._compact_status_log()
             self.window_tracker.release_lock()
             self.has_lock = False
+
+    def _index_media_rows(self):
+        """Build the path -> row lookup used for O(1) status writes"""
+        self._path_to_idx = {row['file_path']: i for i, row in enumerate(self.media_rows)}
+
+    def _read_media_list(self, media_list_path):
+        """Load the media list into self.media_rows, adding the
+        _STATUS_ column on first contact. CSV is the native format; a
+        .parquet media list is read through pandas when available."""
+        if media_list_path.suffix == '.parquet':
+            # Optional columnar path for very large lists; pandas is
+            # imported only when someone actually opts in
+            import pandas as pd
+            df = pd.read_parquet(media_list_path)
+            self._media_fields = list(df.columns)
+            # NaN is truthy and would leak into captions as the string
+            # "nan"; materialize missing cells as None like the CSV path
+            # (where() reads other=None as the NaN default, so cast to
+            # object first to make the replacement stick)
+            df = df.astype(object).where(pd.notna(df), None)
+            self.media_rows = df.to_dict('records')
+        else:
+            with open(media_list_path, newline='') as f:
+                reader = csv.DictReader(f)
+                if reader.fieldnames is None:
+                    raise SchedulerConfigError("Media list file is empty")
+                self._media_fields = list(reader.fieldnames)
+                self.media_rows = list(reader)
+        self._media_mtime = media_list_path.stat().st_mtime_ns
+
+        if '_STATUS_' not in self._media_fields:
+            logger.info("Adding _STATUS_ column to media list")
+            self._media_fields.append('_STATUS_')
+            for row in self.media_rows:
+                row['_STATUS_'] = MediaStatus.PENDING
+            self._write_media_list()
+        else:
+            # Missing cells come back as None; normalize to pending
+            for row in self.media_rows:
+                if row.get('_STATUS_') is None:
+                    row['_STATUS_'] = MediaStatus.PENDING
+
+        self._index_media_rows()
+        # Fold in any statuses journaled since the CSV was last compacted
+        self._replay_status_log()
+
+    def _write_media_list(self):
+        """Atomically write self.media_rows back to the media list"""
+        # Serialize everything first, then swap the finished file into
+        # place so a crash mid-write can't leave a truncated media list
+        tmp = self._media_list_path.with_suffix(self._media_list_path.suffix + '.tmp')
+        if self._media_list_path.suffix == '.parquet':
+            import pandas as pd
+            pd.DataFrame(self.media_rows, columns=self._media_fields).to_parquet(tmp, index=False)
+        else:
+            buf = io.StringIO()
+            writer = csv.DictWriter(buf, fieldnames=self._media_fields)
+            writer.writeheader()
+            writer.writerows(self.media_rows)
+            with open(tmp, 'w', newline='') as f:
+                f.write(buf.getvalue())
+        os.replace(tmp, self._media_list_path)
+        self._media_mtime = self._media_list_path.stat().st_mtime_ns
+
+    def _replay_status_log(self):
+        """Apply journaled status updates onto the in-memory media list"""
+        if self._status_log is None or not self._status_log.exists():
+            return
+        try:
+            with open(self._status_log) as f:
+                for line in f:
+                    line = line.rstrip('\n')
+                    if not line:
+                        continue
+                    media_path, _, status = line.rpartition('\t')
+                    i = self._path_to_idx.get(media_path)
+                    if i is not None:
+                        self.media_rows[i]['_STATUS_'] = status
+        except Exception as e:
+            logger.error(f"Failed to replay status journal: {e}")
+
+    def _compact_status_log(self):
+        """Fold journaled statuses into the media list CSV and drop the journal"""
+        if self._status_log is None or not self._status_log.exists():
+            return
+        try:
+            if self.media_rows is not None:
+                self._write_media_list()
+            self._status_log.unlink()
+        except Exception as e:
+            logger.error(f"Failed to compact status journal: {e}")
         
     def _signal_handler(self, signum, frame):
         """Handle termination signals"""
         sig_name = signal.Signals(signum).name
         logger.info(f"Received signal {sig_name}, shutting down gracefully")
+        # Wake any pending wait so the loop doesn't linger
+        self._shutdown_event.set()
         # Run cleanup and exit
         self._cleanup()
         exit(0)
 
+    def _load_config_yaml(self):
+        """Parse the scheduler YAML, going through a pickled sidecar
+        keyed by the source file's (mtime, size) so unchanged configs
+        skip the YAML parse across restarts"""
+        config_path = Path(self.config_path)
+        st = config_path.stat()
+        key = (st.st_mtime_ns, st.st_size)
+
+        # Deep-copied on hit: validation mutates the dict in place
+        mem_key = (str(config_path), *key)
+        cached = _YAML_CACHE.get(mem_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        cache_path = config_path.with_suffix(config_path.suffix + '.pkl')
+        try:
+            with open(cache_path, 'rb') as f:
+                cached_key, config = pickle.load(f)
+            if cached_key == key:
+                _YAML_CACHE[mem_key] = copy.deepcopy(config)
+                return config
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+            pass
+
+        with open(config_path) as f:
+            config = yaml.load(f, Loader=_YamlLoader)
+        _YAML_CACHE[mem_key] = copy.deepcopy(config)
+
+        try:
+            tmp = cache_path.with_suffix(cache_path.suffix + '.tmp')
+            with open(tmp, 'wb') as f:
+                pickle.dump((key, config), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, cache_path)
+        except OSError:
+            # Cache is best-effort; a read-only config dir is fine
+            pass
+        return config
+
     def validate_and_load_config(self):
         """Validate and load all configuration files"""
         try:
-            with open(self.config_path) as f:
-                self.config = yaml.safe_load(f)
+            self.config = self._load_config_yaml()
                 
             required_keys = ['schedule', 'media_list']
             missing = [k for k in required_keys if k not in self.config]
@@ -94,6 +258,8 @@ class MediaScheduler:
                 # Set defaults for optional fields
                 entry.setdefault('window_hours', 0)
                 entry.setdefault('max_tasks', 1)
+                # Hoisted so window checks don't rebuild it per call
+                entry['_window_td'] = timedelta(hours=entry['window_hours'])
                     
         except yaml.YAMLError as e:
             raise SchedulerConfigError(f"Invalid YAML in scheduler config: {e}")
@@ -102,28 +268,23 @@ class MediaScheduler:
         media_list_path = Path(self.config['media_list'])
         if not media_list_path.exists():
             raise SchedulerConfigError(f"Media list not found: {media_list_path}")
-            
+
         try:
-            self.media_df = pd.read_csv(media_list_path)
+            self._media_list_path = media_list_path
+            self._status_log = media_list_path.with_suffix('.status.log')
+            self._read_media_list(media_list_path)
+
             required_columns = ['file_path']  # Only file_path is required
-            missing = [c for c in required_columns if c not in self.media_df.columns]
+            missing = [c for c in required_columns if c not in self._media_fields]
             if missing:
                 raise SchedulerConfigError(f"Media list missing columns: {missing}")
-                
-            # Initialize status column if it doesn't exist
-            if '_STATUS_' not in self.media_df.columns:
-                logger.info("Adding _STATUS_ column to media list")
-                self.media_df['_STATUS_'] = MediaStatus.PENDING
-                self.media_df.to_csv(media_list_path, index=False)
-                logger.info("Media list updated with _STATUS_ column")
-                
-        except pd.errors.EmptyDataError:
-            raise SchedulerConfigError("Media list file is empty")
-        except pd.errors.ParserError as e:
+
+        except csv.Error as e:
             raise SchedulerConfigError(f"Invalid CSV format in media list: {e}")
             
         # Initialize cron iterators for each schedule
         self.cron_iters = [croniter(entry['cron'], datetime.now()) for entry in self.config['schedule']]
+        self._cron_cache = [None] * len(self.cron_iters)
         self.schedule_config = {i: entry for i, entry in enumerate(self.config['schedule'])}
 
     def update_media_list(self, new_path):
@@ -131,36 +292,85 @@ class MediaScheduler:
         self.config['media_list'] = str(new_path)
         self.validate_and_load_config()
 
+    @staticmethod
+    def _window_start(cron, last_time, from_time, window_td):
+        """Earliest cron tick whose window still covers from_time.
+
+        When window_hours exceeds the cron interval several past ticks'
+        windows overlap from_time; the earliest open window must win so
+        max_tasks accounting keeps one key per window instead of
+        resetting on every newer tick. Returns None when no window
+        covers from_time. Leaves the iterator position unspecified.
+        """
+        if not (last_time <= from_time <= last_time + window_td):
+            return None
+        earliest = last_time
+        while True:
+            prev_time = cron.get_prev(datetime)
+            if from_time > prev_time + window_td:
+                return earliest
+            earliest = prev_time
+
+    def _single_schedule_time(self, from_time):
+        """get_next_schedule_time specialized for one-schedule configs:
+        no list accumulators or min() passes"""
+        window_td = self.schedule_config[0]['_window_td']
+        cached = self._cron_cache[0]
+        # A cached answer holds until the next fire arrives or the
+        # earliest open window closes, whichever comes first
+        if (cached is not None and cached[0] <= from_time < cached[1]
+                and (cached[2] is None or from_time <= cached[2] + window_td)):
+            last_time, next_time, window_start = cached
+        else:
+            cron = self.cron_iters[0]
+            cron.set_current(from_time + _TICK_EPSILON, force=True)
+            last_time = cron.get_prev(datetime)
+            window_start = self._window_start(cron, last_time, from_time, window_td)
+            cron.set_current(from_time, force=True)
+            next_time = cron.get_next(datetime)
+            self._cron_cache[0] = (last_time, next_time, window_start)
+
+        self.current_schedule_idx = 0
+        if window_start is not None:
+            return window_start
+        return next_time
+
     def get_next_schedule_time(self, from_time=None):
         """Calculate the next schedule time"""
         if from_time is None:
             from_time = datetime.now()
 
+        # Single-schedule configs are the common deployment; take the
+        # straight-line path
+        if len(self.cron_iters) == 1:
+            return self._single_schedule_time(from_time)
+
         # First check if we're in any current window
         current_times = []
+        next_times = []
         for i, cron in enumerate(self.cron_iters):
-            # Reset iterator to current time
-            cron = croniter(self.config['schedule'][i]['cron'], from_time)
-            window_hours = self.schedule_config[i]['window_hours']
-            
-            # Get the most recent schedule time
-            last_time = cron.get_prev(datetime)
-            
-            # Check previous schedule times within max window duration
-            # This ensures we don't miss a window that started earlier
-            max_window_hours = max(entry['window_hours'] for entry in self.config['schedule'])
-            check_range = timedelta(hours=max_window_hours)
-            earliest_check = from_time - check_range
-            
-            while last_time >= earliest_check:
-                window_end = last_time + timedelta(hours=window_hours)
-                # If current time is within this window
-                if last_time <= from_time <= window_end:
-                    current_times.append((last_time, i))
-                try:
-                    last_time = cron.get_prev(datetime)
-                except:
-                    break  # Stop if we can't get more previous times
+            window_td = self.schedule_config[i]['_window_td']
+            # The cached answer for a schedule only changes when
+            # from_time crosses the next fire or the earliest open
+            # window closes; until then it serves both checks without
+            # touching croniter
+            cached = self._cron_cache[i]
+            if (cached is not None and cached[0] <= from_time < cached[1]
+                    and (cached[2] is None or from_time <= cached[2] + window_td)):
+                last_time, next_time, window_start = cached
+            else:
+                # Re-anchor the iterator built at config load rather
+                # than re-parsing the cron expression
+                cron.set_current(from_time + _TICK_EPSILON, force=True)
+                last_time = cron.get_prev(datetime)
+                window_start = self._window_start(cron, last_time, from_time, window_td)
+                cron.set_current(from_time, force=True)
+                next_time = cron.get_next(datetime)
+                self._cron_cache[i] = (last_time, next_time, window_start)
+
+            if window_start is not None:
+                current_times.append((window_start, i))
+            next_times.append((next_time, i))
 
         # If we're in any window, return the earliest one
         if current_times:
@@ -168,14 +378,6 @@ class MediaScheduler:
             self.current_schedule_idx = config_idx
             return current_time
 
-        # If not in any window, find next schedule time
-        next_times = []
-        for i, cron in enumerate(self.cron_iters):
-            # Reset iterator to current time
-            cron = croniter(self.config['schedule'][i]['cron'], from_time)
-            next_time = cron.get_next(datetime)
-            next_times.append((next_time, i))
-
         # Return the earliest next time
         if next_times:
             next_time, config_idx = min(next_times, key=lambda x: x[0])
@@ -184,18 +386,20 @@ class MediaScheduler:
             
         return None
 
-    def is_within_window(self, schedule_time):
+    def is_within_window(self, schedule_time, now=None):
         """Check if current time is within the window of a scheduled time"""
-        now = datetime.now()
+        if now is None:
+            now = datetime.now()
         window_config = self.schedule_config[self.current_schedule_idx]
-        window_hours = window_config['window_hours']
-        window_end = schedule_time + timedelta(hours=window_hours)
+        window_end = schedule_time + window_config['_window_td']
         
-        # Reset task counter if we've moved to a new window
+        # Reset task counter if we've moved to a new window; the formatted
+        # key is cached so repeated calls in the same window skip strftime
         if self.current_window != schedule_time:
             self.current_window = schedule_time
-            window_key = schedule_time.strftime("%Y-%m-%d %H:%M")
-            self.tasks_in_window = self.window_tracker.get_tasks_in_window(window_key)
+            self._current_window_key = schedule_time.strftime("%Y-%m-%d %H:%M")
+            self._window_exhausted_for = None
+            self.tasks_in_window = self.window_tracker.get_tasks_in_window(self._current_window_key)
             
         # Check if we're within window and haven't exceeded max tasks
         if schedule_time <= now <= window_end:
@@ -203,34 +407,45 @@ class MediaScheduler:
             if self.tasks_in_window < max_tasks:
                 return True
             else:
-                logger.info(f"Maximum tasks ({max_tasks}) already completed for this window")
+                if self._window_exhausted_for != schedule_time:
+                    logger.info(f"Maximum tasks ({max_tasks}) already completed for this window")
+                # Remember so later media lookups in this window can bail
+                # out before touching the media list at all
+                self._window_exhausted_for = schedule_time
         
         return False
 
     def get_next_unprocessed_media(self):
-        """Get the next unprocessed media item"""
-        # Reload media list to get latest status
-        media_list_path = Path(self.config['media_list'])
+        """
+        Get the next unprocessed media item.
+
+        Callers must check is_within_window first (as the run loop does):
+        outside posting windows this would otherwise stat/reload the
+        media list on every tick for nothing.
+        """
+        # Saturated window: nothing will be uploaded until it rolls over,
+        # so skip the stat/reload entirely
+        if self._window_exhausted_for is not None and self._window_exhausted_for == self.current_window:
+            return None
+
+        # Reload media list only when the file changed on disk; in steady
+        # state (no external edits) the in-memory rows are served as-is
+        media_list_path = self._media_list_path
         try:
-            self.media_df = pd.read_csv(media_list_path)
-            
-            # Add _STATUS_ column if it doesn't exist
-            if '_STATUS_' not in self.media_df.columns:
-                self.media_df['_STATUS_'] = MediaStatus.PENDING
-                self.media_df.to_csv(media_list_path, index=False)
-                
+            mtime = media_list_path.stat().st_mtime_ns
+            if mtime != self._media_mtime or self.media_rows is None:
+                self._read_media_list(media_list_path)
         except Exception as e:
             logger.error(f"Failed to reload media list: {e}")
             return None
 
-        # Consider anything that's not explicitly PROCESSED or ERROR as pending
-        unprocessed = self.media_df[self.media_df['_STATUS_'].apply(MediaStatus.is_pending)]
-        if unprocessed.empty:
+        # Consider anything that's not explicitly PROCESSED or ERROR as
+        # pending; first match wins, no intermediate list
+        item = next((row for row in self.media_rows
+                     if row['_STATUS_'] not in _TERMINAL_STATUSES), None)
+        if item is None:
             logger.info("No unprocessed media items remaining")
-            return None
-            
-        # Get first unprocessed item
-        return unprocessed.iloc[0]
+        return item
 
     def mark_status(self, media_path, status):
         """
@@ -241,44 +456,86 @@ class MediaScheduler:
             status: Status to set (use MediaStatus constants)
         """
         try:
-            idx = self.media_df[self.media_df['file_path'] == media_path].index
-            self.media_df.loc[idx, '_STATUS_'] = status
-            # Immediately write to file to persist the status
-            self.media_df.to_csv(self.config['media_list'], index=False)
+            # Hash lookup instead of a full scan per call
+            i = self._path_to_idx[media_path]
+            self.media_rows[i]['_STATUS_'] = status
+            # Persist as an O(1) append to the status journal; the full
+            # CSV is only rewritten when the journal is compacted on
+            # shutdown, instead of re-serializing every row per upload
+            with open(self._status_log, 'a') as f:
+                f.write(f"{media_path}\t{status}\n")
+                f.flush()
+                os.fsync(f.fileno())
             logger.info(f"Marked {media_path} as {status}")
         except Exception as e:
             logger.error(f"Failed to mark item status: {e}")
 
-    def insta_upload(self, media_item):
-        """Run the upload script with the media item"""
-        try:
+    def _run_upload(self, media_item):
+        """Run one upload, in-process by default.
+
+        Importing the uploader and calling it directly skips a fresh
+        interpreter plus selenium import per upload; set
+        use_subprocess_upload: true in the config to keep the old
+        isolated-process behaviour.
+
+        Returns:
+            int: Uploader exit code (0 on success)
+        """
+        if self.config.get('use_subprocess_upload'):
             command = [
                 'python', 'run.py', 'insta-upload',
                 '-f', media_item['file_path']
             ]
-            
-            # Add caption if it exists in media list and is not empty
-            if 'caption' in media_item and pd.notna(media_item['caption']):
+            if media_item.get('caption'):
                 command.extend(['-c', media_item['caption']])
-            
-            # Add extra caption if provided
             if self.extra_caption:
                 command.extend(['--extra-caption', self.extra_caption])
-                
-            # Add no-headless flag if headless is False
             if not self.headless:
                 command.append('--no-headless')
-                
-            result = subprocess.run(command, check=True)
-            
-            if result.returncode == 0:
+            return subprocess.run(command, check=True).returncode
+
+        import argparse
+        from .uploader import main as uploader_main
+        upload_args = argparse.Namespace(
+            file=media_item['file_path'],
+            caption=media_item.get('caption') or None,
+            extra_caption=self.extra_caption,
+            headless=self.headless
+        )
+        returncode = uploader_main(upload_args, driver=self._get_window_driver())
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, 'insta-upload')
+        return returncode
+
+    def _get_window_driver(self):
+        """Open a Chrome driver on first use and keep it for the rest of
+        the posting window, amortizing browser startup over N uploads"""
+        if self._driver is None:
+            from .utils import get_chrome_driver
+            self._driver = get_chrome_driver(headless=self.headless)
+        return self._driver
+
+    def _close_window_driver(self):
+        """Quit the per-window Chrome driver, if one is open"""
+        if self._driver is not None:
+            try:
+                self._driver.quit()
+            except Exception as e:
+                logger.warning(f"Failed to close Chrome driver: {e}")
+            self._driver = None
+
+    def insta_upload(self, media_item):
+        """Upload the media item and record the outcome"""
+        try:
+            returncode = self._run_upload(media_item)
+
+            if returncode == 0:
                 self.mark_status(media_item['file_path'], MediaStatus.PROCESSED)
                 logger.info(f"Successfully processed {media_item['file_path']}")
                 self.tasks_in_window += 1
                 # Record task in window tracker
                 if self.current_window:
-                    window_key = self.current_window.strftime("%Y-%m-%d %H:%M")
-                    self.window_tracker.record_task(window_key, self.tasks_in_window)
+                    self.window_tracker.record_task(self._current_window_key, self.tasks_in_window)
                 logger.info(f"Tasks completed in current window: {self.tasks_in_window}")
                 return True
         except subprocess.CalledProcessError as e:
@@ -288,6 +545,10 @@ class MediaScheduler:
             self.tasks_in_window -= 1
         return False
 
+    def _sleep(self, seconds):
+        """Interruptible sleep; returns True if shutdown was requested"""
+        return self._shutdown_event.wait(max(1, seconds))
+
     def run(self):
         """Main scheduler loop"""
         # Create lock file (unless force is True)
@@ -306,30 +567,44 @@ class MediaScheduler:
         
         try:
             while True:
-                next_schedule = self.get_next_schedule_time()
+                # One clock read per iteration, threaded through the
+                # checks below so they all agree on "now"
                 now = datetime.now()
+                next_schedule = self.get_next_schedule_time(now)
                 
                 # If next schedule is in future, print waiting message
                 if next_schedule > now:
                     wait_time = next_schedule - now
-                    hours, remainder = divmod(wait_time.seconds, 3600)
-                    minutes, seconds = divmod(remainder, 60)
-                    time_str = []
-                    if hours > 0:
-                        time_str.append(f"{hours} hour{'s' if hours != 1 else ''}")
-                    if minutes > 0:
-                        time_str.append(f"{minutes} minute{'s' if minutes != 1 else ''}")
-                    if seconds > 0 and not hours and minutes < 5:  # Only show seconds if less than 5 minutes away
-                        time_str.append(f"{seconds} second{'s' if seconds != 1 else ''}")
-                    
-                    wait_str = " and ".join(time_str) if len(time_str) <= 2 else ", ".join(time_str[:-1]) + f" and {time_str[-1]}"
-                    logger.info(f"Waiting for next scheduled task at {next_schedule.strftime('%H:%M')} ({wait_str} from now)")
-                    time.sleep(60)
+                    # The friendly countdown is only worth assembling if
+                    # someone will see it
+                    if logger.isEnabledFor(logging.INFO):
+                        hours, remainder = divmod(wait_time.seconds, 3600)
+                        minutes, seconds = divmod(remainder, 60)
+                        time_str = []
+                        if hours > 0:
+                            time_str.append(f"{hours} hour{'s' if hours != 1 else ''}")
+                        if minutes > 0:
+                            time_str.append(f"{minutes} minute{'s' if minutes != 1 else ''}")
+                        if seconds > 0 and not hours and minutes < 5:  # Only show seconds if less than 5 minutes away
+                            time_str.append(f"{seconds} second{'s' if seconds != 1 else ''}")
+
+                        wait_str = " and ".join(time_str) if len(time_str) <= 2 else ", ".join(time_str[:-1]) + f" and {time_str[-1]}"
+                        logger.info(f"Waiting for next scheduled task at {next_schedule.strftime('%H:%M')} ({wait_str} from now)")
+                    self._close_window_driver()
+                    # Sleep until the schedule opens instead of waking every
+                    # minute; capped so clock/config drift is picked up, and
+                    # interruptible so signals don't wait out the timeout
+                    if self._sleep(min(3600, wait_time.total_seconds())):
+                        break
                     continue
 
                 # Check if we're in a posting window
-                if not self.is_within_window(next_schedule):
-                    time.sleep(60)
+                if not self.is_within_window(next_schedule, now):
+                    # The window closed (or is saturated); don't keep a
+                    # browser sitting around until the next one
+                    self._close_window_driver()
+                    if self._sleep(60):
+                        break
                     continue
 
                 # Get next unprocessed media
@@ -340,10 +615,12 @@ class MediaScheduler:
                 else:
                     # No media to process, wait longer
                     logger.info("No unprocessed media available, waiting 5 minutes before checking again")
-                    time.sleep(300)  # Wait 5 minutes before checking again
+                    if self._sleep(300):  # Wait 5 minutes before checking again
+                        break
                 
                 # Short sleep before next iteration
-                time.sleep(60)
+                if self._sleep(30):
+                    break
         except Exception as e:
             logger.exception("Error in scheduler loop")
             return False
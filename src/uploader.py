@@ -3,7 +3,10 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from src.utils import (
     get_config_data, 
+    load_env_from_json, 
+    insert_text, 
     retry_get_element, 
+    dismiss_while_present, 
     set_environment_variables, 
     get_chrome_driver,
     wait_for_element_to_disappear,
@@ -41,20 +44,24 @@ def get_or_generate_caption(media_path: str, caption: str = None) -> str:
         logger.warning(f"Failed to generate caption: {e}")
         return None
 
-def validate_upload_requirements(args, config):
+def validate_upload_requirements(args, config, upload_config_lines=None):
     """
     Validate all requirements before starting the upload process
     
     Args:
         args: Command line arguments
         config: Instagram configuration (already validated)
+        upload_config_lines: Pre-read lines of the upload config file;
+            read here when not provided
         
     Raises:
         InstagramUploaderError: If any validation fails
     """
     # Get media path from args or config
-    config_data = get_config_data("config/instagram_upload_config.txt")
-    config_lines = config_data.strip().split('\n') if config_data else []
+    if upload_config_lines is None:
+        config_data = get_config_data("config/instagram_upload_config.txt")
+        upload_config_lines = config_data.strip().split('\n') if config_data else []
+    config_lines = upload_config_lines
     
     # Use command line args if provided, otherwise use config file for media path
     post_media_path = args.file if args.file else (config_lines[0].strip() if len(config_lines) > 0 else "")
@@ -93,7 +100,76 @@ def validate_upload_requirements(args, config):
             
     return post_media_path, post_caption
 
-def main(args=None):
+def ensure_logged_in(driver, config):
+    """
+    Navigate to Instagram and log in if the session isn't active
+    
+    Args:
+        driver: Chrome WebDriver instance
+        config: Instagram configuration with credentials
+    """
+    logger.info("Navigating to Instagram login page")
+    driver.get("https://www.instagram.com/accounts/login/")
+    
+    logger.info("Checking login status")
+    retelement = retry_get_element(driver, [XPATH_HOME_ICON, XPATH_USERNAME_INPUT])
+
+    if retelement.get_attribute("aria-label") == "Home":
+        logger.info("Already logged in")
+    else:
+        logger.info("Login required, attempting login")
+        logger.info("Submitting login credentials")
+        retry_get_element(driver, "//input[@name='username']").send_keys(config.username)
+        retry_get_element(driver, "//input[@name='password']").send_keys(config.password + Keys.RETURN)
+
+        logger.info("Handling post-login prompts")
+        dismissed = dismiss_while_present(driver, XPATH_NOT_NOW_BUTTON)
+        if dismissed:
+            logger.info(f"Dismissed {dismissed} post-login prompt(s)")
+        else:
+            logger.debug("No post-login prompts found")
+
+def upload_media(driver, post_media_path, post_caption):
+    """
+    Create and share a single post with a logged-in driver
+    
+    Args:
+        driver: Logged-in Chrome WebDriver instance
+        post_media_path: Path to the media file
+        post_caption: Caption text for the post
+    """
+    logger.info("Initiating new post creation")
+    retry_get_element(driver, XPATH_NEW_POST_BUTTON).click()
+
+    logger.info("Uploading media file")
+    retry_get_element(driver, XPATH_FILE_INPUT).send_keys(post_media_path)
+
+    logger.info("Configuring post settings")
+    retry_get_element(driver, XPATH_SELECT_CROP).click()
+    retry_get_element(driver, XPATH_ORIGINAL_CROP).click()
+    retry_get_element(driver, XPATH_NEXT_BUTTON).click()
+
+    logger.info("Checking post type")
+    heading_label = retry_get_element(driver, [XPATH_EDIT_HEADING, XPATH_NEW_REEL_HEADING])
+    if heading_label.text == "Edit":
+        logger.info("Edit Step found -- skipping")
+        retry_get_element(driver, XPATH_NEXT_BUTTON).click()
+    else:
+        logger.info("New Post Step found -- posting media")
+
+    logger.info("Adding caption")
+    insert_text(driver, retry_get_element(driver, XPATH_CAPTION_INPUT), post_caption)
+    
+    logger.info("Sharing post")
+    retry_get_element(driver, XPATH_SHARE_BUTTON).click()
+
+    logger.info("Waiting for upload completion")
+    wait_for_element_to_disappear(driver, XPATH_NEW_REEL_HEADING)
+    wait_for_element_to_disappear(driver, XPATH_REEL_SHARING_HEADING, 60)
+    retry_get_element(driver, [XPATH_REEL_SHARED_HEADING, XPATH_POST_SHARED_HEADING])
+    logger.info("Upload completed successfully")
+
+def main(args=None, driver=None):
     try:
         logger.info("Starting Instagram upload process")
         if args is None:
@@ -101,75 +177,32 @@ def main(args=None):
         
         # Load configuration
         try:
-            config = InstagramConfig.from_json(Path("config/env_config.json"))
+            # load_env_from_json caches on mtime, so the env config is
+            # opened and parsed at most once per process
+            config = InstagramConfig.from_json(load_env_from_json())
             logger.info("Configuration loaded successfully")
         except Exception as e:
             raise InstagramUploaderError(f"Failed to load configuration: {e}")
         
         # Validate all requirements before starting
         logger.info("Validating upload requirements")
-        post_media_path, post_caption = validate_upload_requirements(args, config)
+        config_data = get_config_data("config/instagram_upload_config.txt")
+        upload_config_lines = config_data.strip().split('\n') if config_data else []
+        post_media_path, post_caption = validate_upload_requirements(
+            args, config, upload_config_lines)
         logger.info("All requirements validated successfully")
         
-        # Now proceed with the actual upload
-        with managed_driver(headless=args.headless) as driver:
-            logger.info("Navigating to Instagram login page")
-            driver.get("https://www.instagram.com/accounts/login/")
-            
-            logger.info("Checking login status")
-            retelement = retry_get_element(driver, [XPATH_HOME_ICON, XPATH_USERNAME_INPUT])
-
-            if retelement.get_attribute("aria-label") == "Home":
-                logger.info("Already logged in")
-            else:
-                logger.info("Login required, attempting login")
-                logger.info("Submitting login credentials")
-                retry_get_element(driver, "//input[@name='username']").send_keys(config.username)
-                retry_get_element(driver, "//input[@name='password']").send_keys(config.password + Keys.RETURN)
-
-                logger.info("Handling post-login prompts")
-                try:
-                    retry_get_element(driver, XPATH_NOT_NOW_BUTTON).click()
-                    logger.info("Dismissed 'Save Login Info' prompt")
-                except:
-                    logger.debug("No 'Save Login Info' prompt found")
-
-                try:
-                    driver.find_element(By.XPATH, XPATH_NOT_NOW_BUTTON).click()
-                    logger.info("Dismissed notifications prompt")
-                except:
-                    logger.debug("No notifications prompt found")
-            
-            logger.info("Initiating new post creation")
-            retry_get_element(driver, XPATH_NEW_POST_BUTTON).click()
-
-            logger.info("Uploading media file")
-            retry_get_element(driver, XPATH_FILE_INPUT).send_keys(post_media_path)
-
-            logger.info("Configuring post settings")
-            retry_get_element(driver, XPATH_SELECT_CROP).click()
-            retry_get_element(driver, XPATH_ORIGINAL_CROP).click()
-            retry_get_element(driver, XPATH_NEXT_BUTTON).click()
-
-            logger.info("Checking post type")
-            heading_label = retry_get_element(driver, [XPATH_EDIT_HEADING, XPATH_NEW_REEL_HEADING])
-            if heading_label.text == "Edit":
-                logger.info("Edit Step found -- skipping")
-                retry_get_element(driver, XPATH_NEXT_BUTTON).click()
-            else:
-                logger.info("New Post Step found -- posting media")
-
-            logger.info("Adding caption")
-            retry_get_element(driver, XPATH_CAPTION_INPUT).send_keys(post_caption)
-            
-            logger.info("Sharing post")
-            retry_get_element(driver, XPATH_SHARE_BUTTON).click()
-
-            logger.info("Waiting for upload completion")
-            wait_for_element_to_disappear(driver, XPATH_NEW_REEL_HEADING)
-            wait_for_element_to_disappear(driver, XPATH_REEL_SHARING_HEADING, 60)
-            retry_get_element(driver, [XPATH_REEL_SHARED_HEADING, XPATH_POST_SHARED_HEADING])
-            logger.info("Upload completed successfully")
+        # Now proceed with the actual upload. A caller-supplied driver
+        # (e.g. the scheduler keeping one browser alive for a whole
+        # posting window) is reused; otherwise open and close our own.
+        if driver is not None:
+            ensure_logged_in(driver, config)
+            upload_media(driver, post_media_path, post_caption)
+        else:
+            with managed_driver(headless=args.headless,
+                                user_data_dir=getattr(args, 'user_data_dir', None)) as driver:
+                ensure_logged_in(driver, config)
+                upload_media(driver, post_media_path, post_caption)
 
     except InstagramUploaderError as e:
         logger.error(f"Instagram upload failed: {e}")
@@ -181,5 +214,57 @@ def main(args=None):
     logger.info("Process completed successfully")
     return 0
 
+# Per-worker Chrome profile, assigned once by _init_upload_worker
+_worker_profile = None
+
+def _init_upload_worker(counter):
+    """Give each pool worker its own Chrome profile directory"""
+    global _worker_profile
+    with counter.get_lock():
+        worker_id = counter.value
+        counter.value += 1
+    _worker_profile = f"data/chrome_user_data_{worker_id}"
+
+def _upload_one(item):
+    """Run one upload inside a pool worker"""
+    import argparse
+    media_path, caption, extra_caption, headless = item
+    args = argparse.Namespace(
+        file=media_path,
+        caption=caption,
+        extra_caption=extra_caption,
+        headless=headless,
+        user_data_dir=_worker_profile
+    )
+    return main(args)
+
+def upload_batch(media_paths, captions, max_workers=3, extra_caption=None, headless=True):
+    """
+    Upload several media files in parallel worker processes.
+    
+    Each worker drives its own Chrome with a separate profile
+    directory, so independent uploads overlap instead of running
+    back-to-back.
+    
+    Args:
+        media_paths: Paths of media files to upload
+        captions: Caption per media file (same length as media_paths)
+        max_workers: Number of parallel Chrome sessions
+        extra_caption: Optional text appended to every caption
+        headless: Whether workers run Chrome headless
+        
+    Returns:
+        list: Uploader exit codes, in input order
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    counter = multiprocessing.Value('i', 0)
+    items = [(m, c, extra_caption, headless) for m, c in zip(media_paths, captions)]
+    with ProcessPoolExecutor(max_workers=max_workers,
+                             initializer=_init_upload_worker,
+                             initargs=(counter,)) as executor:
+        return list(executor.map(_upload_one, items))
+
 if __name__ == "__main__":
     exit(main()) 
\ No newline at end of file
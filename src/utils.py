@@ -1,4 +1,8 @@
 import os
+import stat
+import shutil
+import subprocess
+import atexit
 import time
 from prompt_toolkit import prompt
 from prompt_toolkit.document import Document
@@ -7,18 +11,58 @@ from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException, StaleElementReferenceException, WebDriverException
 import logging
 from typing import Union, List, Optional
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 from contextlib import contextmanager
+from src.exceptions import ElementNotFoundError, ElementNotDisappearError
 
 
 import os
 import json
+import mmap
 from pathlib import Path
 import argparse
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# File-content caches keyed by path -> (mtime_ns, parsed/raw content);
+# unchanged files are served from memory on repeat reads
+_ENV_CACHE = {}
+_CONFIG_CACHE = {}
+
+def load_json_file(path):
+    """
+    Parse a JSON file without intermediate string copies.
+    
+    The file is mmapped and fed to orjson when available, falling back
+    to the stdlib json module otherwise.
+    
+    Args:
+        path: Path to the JSON file
+    
+    Returns:
+        The parsed JSON value
+    """
+    with open(path, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files can't be mapped
+            return json.loads(f.read() or b'{}')
+        try:
+            if orjson is not None:
+                return orjson.loads(memoryview(mm))
+            return json.loads(mm[:])
+        finally:
+            mm.close()
+
 def load_env_from_json():
     """Load environment variables from a JSON file"""
     env_file = Path('config/env_config.json')
@@ -46,8 +90,14 @@ def load_env_from_json():
                 "Please fill in your credentials in config/env_config.json"
             )
     
-    with open(env_file, 'r') as f:
-        return json.load(f)
+    mtime = env_file.stat().st_mtime_ns
+    cached = _ENV_CACHE.get(str(env_file))
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    config = load_json_file(env_file)
+    _ENV_CACHE[str(env_file)] = (mtime, config)
+    return config
 
 def set_environment_variables():
     """Set environment variables from config"""
@@ -65,8 +115,13 @@ def get_config_data(config_file):
     """
     config_content = ""
     if os.path.exists(config_file):
+        mtime = os.stat(config_file).st_mtime_ns
+        cached = _CONFIG_CACHE.get(config_file)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
         with open(config_file, "r") as file:
             config_content = file.read()
+        _CONFIG_CACHE[config_file] = (mtime, config_content)
     # config_content = get_multiline_input("", config_content)
     return config_content
 
@@ -97,17 +152,89 @@ def get_multiline_input(prompt_text="Edit the text below:\n", default_text=""):
         key_bindings=kb
     )
 
-def get_chrome_driver(headless=False):
+class ChromeDriverPool:
+    """
+    Keep one Chrome process alive across WebDriver sessions.
+    
+    When enabled, Chrome is launched once with a remote debugging port
+    and subsequent drivers attach to it via debuggerAddress, skipping
+    the multi-second browser start per upload. Disabled by default;
+    call ChromeDriverPool.enable() to opt in.
+    """
+    _proc = None
+    _port = 9222
+    enabled = False
+
+    @classmethod
+    def enable(cls, port=9222):
+        """Turn on Chrome pooling for drivers created after this call"""
+        cls.enabled = True
+        cls._port = port
+
+    @classmethod
+    def is_alive(cls):
+        """Whether the pooled Chrome process is running"""
+        return cls._proc is not None and cls._proc.poll() is None
+
+    @classmethod
+    def address(cls, headless=False):
+        """Start the pooled Chrome if needed and return its debugger
+        address, or None when no Chrome binary could be found"""
+        if not cls.is_alive():
+            binary = cls._find_chrome()
+            if binary is None:
+                logger.warning("Chrome binary not found; driver pooling disabled")
+                return None
+            command = [
+                binary,
+                f"--remote-debugging-port={cls._port}",
+                f"--user-data-dir={os.path.abspath('data/chrome_user_data')}",
+                "--no-first-run",
+            ]
+            if headless:
+                command.append("--headless")
+            cls._proc = subprocess.Popen(
+                command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+            )
+            # Give the debugger socket a moment to come up
+            time.sleep(1)
+            logger.info(f"Started pooled Chrome on port {cls._port}")
+        return f"127.0.0.1:{cls._port}"
+
+    @staticmethod
+    def _find_chrome():
+        for name in ("google-chrome", "google-chrome-stable",
+                     "chromium", "chromium-browser"):
+            path = shutil.which(name)
+            if path:
+                return path
+        return None
+
+    @classmethod
+    def shutdown(cls):
+        """Terminate the pooled Chrome process, if any"""
+        if cls.is_alive():
+            cls._proc.terminate()
+            try:
+                cls._proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                cls._proc.kill()
+        cls._proc = None
+
+atexit.register(ChromeDriverPool.shutdown)
+
+def get_chrome_driver(headless=False, user_data_dir=None):
     """
     Set up and return a configured Chrome WebDriver instance
     
     Args:
         headless (bool): Whether to run in headless mode
+        user_data_dir (str): Chrome profile directory (parallel workers
+            pass distinct dirs to avoid profile lock contention)
     """
     chrome_options = Options()
-    user_data_dir = "data/chrome_user_data"
+    user_data_dir = user_data_dir or "data/chrome_user_data"
     chrome_options.add_argument(f"--user-data-dir={os.path.abspath(user_data_dir)}")
-    chrome_options.add_argument("--start-maximized")
     chrome_options.add_argument("--disable-notifications")
     chrome_options.add_argument("--disable-infobars") 
     chrome_options.add_argument("--disable-extensions")
@@ -116,6 +243,19 @@ def get_chrome_driver(headless=False):
     
     if headless:
         chrome_options.add_argument("--headless")
+        # Trim subsystems that only cost startup time and memory when
+        # there's no visible window
+        chrome_options.add_argument("--window-size=1920,1080")
+        chrome_options.add_argument("--disable-background-networking")
+        chrome_options.add_argument("--disable-default-apps")
+        chrome_options.add_argument("--disable-sync")
+        chrome_options.add_argument("--disable-translate")
+        chrome_options.add_argument("--metrics-recording-only")
+        chrome_options.add_argument("--no-first-run")
+        chrome_options.add_argument("--no-default-browser-check")
+        chrome_options.add_argument("--mute-audio")
+    else:
+        chrome_options.add_argument("--start-maximized")
 
     # Select appropriate chromedriver based on OS
     if os.name == 'nt':  # Windows
@@ -127,7 +267,51 @@ def get_chrome_driver(headless=False):
         raise FileNotFoundError(f"ChromeDriver not found at {driver_path}")
         
     service = Service(driver_path)
-    return webdriver.Chrome(service=service, options=chrome_options)
+
+    # Attach to the long-lived Chrome instead of launching a fresh one
+    # when pooling is enabled
+    if ChromeDriverPool.enabled:
+        address = ChromeDriverPool.address(headless=headless)
+        if address:
+            attach_options = Options()
+            attach_options.add_experimental_option("debuggerAddress", address)
+            driver = webdriver.Chrome(service=service, options=attach_options)
+            driver.implicitly_wait(0)
+            return driver
+
+    driver = webdriver.Chrome(service=service, options=chrome_options)
+    # No implicit wait: find_elements should return immediately when a
+    # prompt is absent instead of blocking for the implicit timeout;
+    # explicit waits handle the polling
+    driver.implicitly_wait(0)
+    return driver
+
+class _AnyXPathPresent:
+    """Expected condition: the first element matching any of the xpaths"""
+
+    def __init__(self, xpaths):
+        self.xpaths = xpaths
+        # One union query per poll instead of one chromedriver RPC per
+        # xpath; each RPC is a JSON-over-HTTP round trip
+        if len(xpaths) == 1:
+            self.union_xpath = xpaths[0]
+        else:
+            self.union_xpath = " | ".join(f"({xp})" for xp in xpaths)
+
+    def __call__(self, driver):
+        elements = driver.find_elements(By.XPATH, self.union_xpath)
+        if not elements:
+            return False
+        if len(self.xpaths) > 1:
+            # Something is present — re-check per xpath only on this
+            # success path to keep first-listed-xpath-wins semantics
+            for xpath in self.xpaths:
+                matched = driver.find_elements(By.XPATH, xpath)
+                if matched:
+                    logger.debug("Found element with xpath: %s", xpath)
+                    return matched[0]
+        logger.debug("Found element with xpath: %s", self.union_xpath)
+        return elements[0]
 
 def retry_get_element(
     driver: WebDriver, 
@@ -135,7 +319,7 @@ def retry_get_element(
     timeoutseconds: int = 10
 ) -> WebElement:
     """
-    Repeatedly tries to find an element by any of the provided xpaths.
+    Waits for an element matching any of the provided xpaths.
     
     Args:
         driver: Selenium WebDriver instance
@@ -146,27 +330,185 @@ def retry_get_element(
         WebElement: The first found element from the first matching xpath
         
     Raises:
-        TimeoutException: If no elements found within timeout period
+        ElementNotFoundError: If no elements found within timeout period
+    """
+    xpath_list = (xpaths,) if isinstance(xpaths, str) else tuple(xpaths)
+    # %s-style args defer the list-to-string work until a DEBUG handler
+    # actually wants it; this runs on every poll of every wait
+    logger.debug("Looking for elements with xpaths: %s", xpath_list)
+
+    try:
+        # WebDriverWait checks immediately and then every 200ms, instead
+        # of the old fixed 500ms sleep between scans
+        return WebDriverWait(
+            driver, timeoutseconds, poll_frequency=0.2,
+            ignored_exceptions=(StaleElementReferenceException,)
+        ).until(_AnyXPathPresent(xpath_list))
+    except TimeoutException:
+        logger.error(f"Could not find elements with xpaths: {xpath_list}")
+        raise ElementNotFoundError(
+            f"No elements found for any of the provided xpaths within {timeoutseconds} seconds"
+        )
+
+def insert_text(driver, element, text):
+    """
+    Type text into an element in one batch instead of per-keystroke.
+    
+    Focuses the element and pushes the whole string through CDP
+    Input.insertText, which fires the same input events as typing but
+    in a single round trip. Falls back to send_keys when the CDP
+    command is unavailable (e.g. remote drivers).
+    
+    Args:
+        driver: Selenium WebDriver instance
+        element: Target input element
+        text: Text to insert
+    """
+    element.click()
+    try:
+        driver.execute_cdp_cmd("Input.insertText", {"text": text})
+    except Exception:
+        logger.debug("Input.insertText unavailable, falling back to send_keys")
+        element.send_keys(text)
+
+def dismiss_while_present(driver, xpath, total_timeout=5, poll=0.05):
     """
-    xpath_list = [xpaths] if isinstance(xpaths, str) else xpaths
-    logger.debug(f"Looking for elements with xpaths: {xpath_list}")
-    elapsed = 0
-    while elapsed < timeoutseconds:
-        for xpath in xpath_list:
-            elements = driver.find_elements(By.XPATH, xpath)
-            if elements:
-                logger.debug(f"Found element with xpath: {xpath}")
-                return elements[0]
-        time.sleep(0.5)
-        elapsed += 0.5
-    logger.error(f"Could not find elements with xpaths: {xpath_list}")
-    raise Exception(f"No elements found for any of the provided xpaths within {timeoutseconds} seconds")
+    Click away every element matching the xpath until none appear or the
+    deadline passes. Used for transient prompts (e.g. Instagram's
+    stacked "Not Now" dialogs) where each one may reveal the next.
+    
+    Args:
+        driver: Selenium WebDriver instance
+        xpath: XPath of the dismissable element
+        total_timeout: Overall deadline in seconds
+        poll: Initial delay between checks in seconds; backs off
+            exponentially (x1.5, capped at 0.5s) while nothing appears
+    
+    Returns:
+        int: Number of elements dismissed
+    """
+    dismissed = 0
+    delay = poll
+    deadline = time.monotonic() + total_timeout
+    while time.monotonic() < deadline:
+        elements = driver.find_elements(By.XPATH, xpath)
+        if not elements:
+            if dismissed:
+                break
+        else:
+            try:
+                elements[0].click()
+                dismissed += 1
+                logger.debug("Dismissed prompt matching: %s", xpath)
+                # A dismissal often reveals the next prompt right away
+                delay = poll
+            except WebDriverException as e:
+                # Stale nodes, clicks intercepted by a still-animating
+                # overlay, etc. — the next poll retries
+                logger.debug("Dismissal click failed, retrying: %s", e)
+        time.sleep(delay)
+        delay = min(delay * 1.5, 0.5)
+    return dismissed
+
+# Compiled lxml XPath objects, keyed by expression
+_XPATH_COMPILE_CACHE = {}
+
+def snapshot_and_query(driver, xpaths):
+    """
+    Evaluate several xpaths against a single DOM snapshot.
+    
+    Fetches outerHTML once and runs compiled lxml XPaths locally, so N
+    existence checks cost one WebDriver round trip instead of N.
+    
+    Args:
+        driver: Selenium WebDriver instance
+        xpaths: XPath strings to test for presence
+    
+    Returns:
+        dict mapping xpath -> bool, or None when lxml isn't installed
+        or the snapshot failed (callers fall back to find_elements)
+    """
+    try:
+        from lxml import etree
+        from lxml import html as lxml_html
+    except ImportError:
+        return None
+    try:
+        page = driver.execute_script("return document.documentElement.outerHTML")
+        tree = lxml_html.fromstring(page)
+    except Exception as e:
+        logger.debug("DOM snapshot failed (%s)", e)
+        return None
+
+    results = {}
+    for xpath in xpaths:
+        compiled = _XPATH_COMPILE_CACHE.get(xpath)
+        if compiled is None:
+            compiled = etree.XPath(xpath)
+            _XPATH_COMPILE_CACHE[xpath] = compiled
+        try:
+            results[xpath] = bool(compiled(tree))
+        except etree.XPathError:
+            results[xpath] = False
+    return results
 
 def is_home_screen_displayed(driver):
     """Check if the Instagram home screen is displayed by looking for the Home button."""
-    home_elements = driver.find_elements(By.XPATH, "//a[@role='link']//svg[@aria-label='Home']")
+    xpath = "//a[@role='link']//svg[@aria-label='Home']"
+    snapshot = snapshot_and_query(driver, [xpath])
+    if snapshot is not None:
+        return snapshot[xpath]
+    home_elements = driver.find_elements(By.XPATH, xpath)
     return len(home_elements) > 0
 
+def wait_for_xpath_via_cdp(driver, xpath, timeoutseconds=10, appear=True):
+    """
+    Wait inside the browser for an xpath to appear or disappear.
+    
+    One CDP Runtime.evaluate call installs a MutationObserver and
+    resolves its promise on the matching DOM change, replacing
+    poll-every-200ms HTTP round trips with a single event-driven RPC.
+    
+    Args:
+        driver: Selenium WebDriver instance (Chrome)
+        xpath: XPath string to watch
+        timeoutseconds: Maximum time to wait in seconds
+        appear: Wait for presence when True, absence when False
+    
+    Returns:
+        True if the condition was met, False if it timed out, or None
+        when the in-browser wait isn't available on this driver
+    """
+    check = ("document.evaluate(%s, document, null, "
+             "XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue"
+             % json.dumps(xpath))
+    condition = check if appear else f"!({check})"
+    expression = f"""
+        new Promise((resolve) => {{
+            const ok = () => Boolean({condition});
+            if (ok()) return resolve(true);
+            const obs = new MutationObserver(() => {{
+                if (ok()) {{ obs.disconnect(); resolve(true); }}
+            }});
+            obs.observe(document.documentElement,
+                        {{childList: true, subtree: true, attributes: true}});
+            setTimeout(() => {{ obs.disconnect(); resolve(false); }},
+                       {int(timeoutseconds * 1000)});
+        }})
+    """
+    try:
+        result = driver.execute_cdp_cmd("Runtime.evaluate", {
+            "expression": expression,
+            "awaitPromise": True,
+            "returnByValue": True,
+        })
+        if not isinstance(result, dict):
+            return None
+        return result.get("result", {}).get("value") is True
+    except Exception as e:
+        logger.debug("CDP wait unavailable (%s); falling back to polling", e)
+        return None
+
 def wait_for_element_to_disappear(driver: WebDriver, xpath: str, timeoutseconds: int = 10) -> None:
     """
     Waits for an element to disappear by checking the absence of the provided xpath.
@@ -177,19 +519,31 @@ def wait_for_element_to_disappear(driver: WebDriver, xpath: str, timeoutseconds:
         timeoutseconds: Maximum time to wait in seconds (default 10)
     
     Raises:
-        Exception if the element does not disappear within the timeout period.
+        ElementNotDisappearError: If the element does not disappear within the timeout period.
     """
-    logger.debug(f"Waiting for element to disappear: {xpath}")
-    elapsed = 0
-    while elapsed < timeoutseconds:
-        elements = driver.find_elements(By.XPATH, xpath)
-        if not elements:
-            logger.debug(f"Element disappeared: {xpath}")
+    logger.debug("Waiting for element to disappear: %s", xpath)
+    # Prefer the event-driven in-browser wait; fall back to polling on
+    # drivers without CDP support
+    cdp_result = wait_for_xpath_via_cdp(driver, xpath, timeoutseconds, appear=False)
+    if cdp_result is not None:
+        if cdp_result:
+            logger.debug("Element disappeared: %s", xpath)
             return
-        time.sleep(0.5)
-        elapsed += 0.5
-    logger.error(f"Element did not disappear: {xpath}")
-    raise Exception(f"Element with xpath '{xpath}' did not disappear within {timeoutseconds} seconds")
+        logger.error(f"Element did not disappear: {xpath}")
+        raise ElementNotDisappearError(
+            f"Element with xpath '{xpath}' did not disappear within {timeoutseconds} seconds"
+        )
+    try:
+        WebDriverWait(
+            driver, timeoutseconds, poll_frequency=0.2,
+            ignored_exceptions=(StaleElementReferenceException,)
+        ).until(lambda d: not d.find_elements(By.XPATH, xpath))
+        logger.debug("Element disappeared: %s", xpath)
+    except TimeoutException:
+        logger.error(f"Element did not disappear: {xpath}")
+        raise ElementNotDisappearError(
+            f"Element with xpath '{xpath}' did not disappear within {timeoutseconds} seconds"
+        )
 
 # Configure logging
 def setup_logging():
@@ -208,23 +562,45 @@ def setup_logging():
     )
     return logging.getLogger(__name__)
 
-logger = setup_logging()
+_logger = None
+
+def _get_logger():
+    """Initialize logging on first use"""
+    global _logger
+    if _logger is None:
+        _logger = setup_logging()
+    return _logger
+
+class _LoggerProxy:
+    """Defers setup_logging — creating logs/ and opening the file
+    handler — until the first actual log call, so merely importing this
+    module stays side-effect free"""
+
+    def __getattr__(self, name):
+        return getattr(_get_logger(), name)
+
+logger = _LoggerProxy()
 
 @contextmanager
-def managed_driver(headless=False):
+def managed_driver(headless=False, user_data_dir=None):
     """
     Context manager for the Chrome WebDriver
     
     Args:
         headless (bool): Whether to run in headless mode
+        user_data_dir (str): Optional Chrome profile directory
     """
     driver = None
     try:
-        driver = get_chrome_driver(headless=headless)
+        driver = get_chrome_driver(headless=headless, user_data_dir=user_data_dir)
         yield driver
     finally:
         if driver:
-            driver.quit()
+            if ChromeDriverPool.enabled and ChromeDriverPool.is_alive():
+                # Pooled Chrome stays up; just drop this session's tab
+                driver.close()
+            else:
+                driver.quit()
 
 def verify_file_exists(file_path: str) -> str:
     """
@@ -239,16 +615,23 @@ def verify_file_exists(file_path: str) -> str:
     Raises:
         FileNotFoundError: If the file doesn't exist or isn't accessible
     """
-    path = Path(file_path).resolve()  # Convert to absolute path
-    if not path.exists():
+    # Already-absolute paths (the common case from the scheduler) skip
+    # normalization entirely; abspath never touches the filesystem either
+    # way, unlike the resolve() it replaced
+    abs_path = file_path if os.path.isabs(file_path) else os.path.abspath(file_path)
+    # One stat answers existence and file-ness; the old
+    # resolve/exists/is_file chain cost a syscall apiece
+    try:
+        st = os.stat(abs_path)
+    except (FileNotFoundError, NotADirectoryError):
         raise FileNotFoundError(f"Upload file not found: {file_path}")
-    if not path.is_file():
+    if not stat.S_ISREG(st.st_mode):
         raise FileNotFoundError(f"Path exists but is not a file: {file_path}")
-    if not os.access(path, os.R_OK):
+    if not os.access(abs_path, os.R_OK):
         raise PermissionError(f"File exists but is not readable: {file_path}")
     
     # Return OS-appropriate absolute path as string
-    return str(path)
+    return abs_path
 
 def parse_arguments():
     """Parse command line arguments"""
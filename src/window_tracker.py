@@ -1,8 +1,24 @@
 import json
+import os
+import threading
 from datetime import datetime
 from pathlib import Path
 import logging
 
+# OS-level advisory locking: flock on POSIX, msvcrt on Windows
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+# orjson serializes/parses several times faster than the stdlib json;
+# fall back quietly when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 class WindowTracker:
@@ -11,33 +27,96 @@ class WindowTracker:
         self.data_dir.mkdir(exist_ok=True)
         self.window_file = self.data_dir / "window_tasks.json"
         self.lock_file = self.data_dir / "scheduler.lock"
+        # Parsed window tasks, invalidated when the file changes on disk
+        self._cache = None
+        self._cache_mtime = None
+        # Serializes read-modify-write of the tasks file across threads
+        self._write_lock = threading.Lock()
+        self._lock_fd = None
         
+    @staticmethod
+    def _try_lock(fd):
+        """Take a non-blocking exclusive lock on fd; False if held elsewhere"""
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            return True
+        except OSError:
+            return False
+
     def is_scheduler_running(self):
         """Check if scheduler is already running"""
-        return self.lock_file.exists()
+        if self._lock_fd is not None:
+            return True
+        try:
+            fd = os.open(self.lock_file, os.O_RDWR | os.O_CREAT)
+        except OSError as e:
+            logger.error(f"Failed to probe lock: {e}")
+            return False
+        try:
+            if self._try_lock(fd):
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+                else:
+                    msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+                return False
+            return True
+        finally:
+            os.close(fd)
         
     def create_lock(self):
-        """Create scheduler lock file"""
-        try:
-            self.lock_file.touch(exist_ok=False)
+        """Acquire the scheduler lock.
+
+        Advisory OS lock instead of a lockfile-existence check: atomic
+        (no check-then-create race) and released by the kernel if the
+        process dies, so a crash can't leave a stale lock behind.
+        """
+        if self._lock_fd is not None:
             return True
-        except FileExistsError:
+        try:
+            fd = os.open(self.lock_file, os.O_RDWR | os.O_CREAT)
+        except OSError as e:
+            logger.error(f"Failed to open lock file: {e}")
             return False
+        if self._try_lock(fd):
+            self._lock_fd = fd
+            return True
+        os.close(fd)
+        return False
             
     def release_lock(self):
-        """Release scheduler lock file"""
+        """Release scheduler lock"""
+        if self._lock_fd is None:
+            return
         try:
+            if fcntl is not None:
+                fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+            else:
+                msvcrt.locking(self._lock_fd, msvcrt.LK_UNLCK, 1)
+            os.close(self._lock_fd)
             self.lock_file.unlink(missing_ok=True)
         except Exception as e:
             logger.error(f"Failed to release lock: {e}")
+        finally:
+            self._lock_fd = None
             
     def get_window_tasks(self):
         """Get tasks executed in windows"""
         if not self.window_file.exists():
             return {}
         try:
-            with open(self.window_file) as f:
-                return json.load(f)
+            mtime = self.window_file.stat().st_mtime_ns
+            if self._cache is not None and self._cache_mtime == mtime:
+                return self._cache
+            if orjson is not None:
+                self._cache = orjson.loads(self.window_file.read_bytes())
+            else:
+                with open(self.window_file) as f:
+                    self._cache = json.load(f)
+            self._cache_mtime = mtime
+            return self._cache
         except Exception as e:
             logger.error(f"Failed to read window tasks: {e}")
             return {}
@@ -45,16 +124,22 @@ class WindowTracker:
     def save_window_tasks(self, tasks):
         """Save window tasks to file"""
         try:
-            with open(self.window_file, 'w') as f:
-                json.dump(tasks, f)
+            if orjson is not None:
+                self.window_file.write_bytes(orjson.dumps(tasks))
+            else:
+                with open(self.window_file, 'w') as f:
+                    json.dump(tasks, f)
+            self._cache = tasks
+            self._cache_mtime = self.window_file.stat().st_mtime_ns
         except Exception as e:
             logger.error(f"Failed to save window tasks: {e}")
             
     def record_task(self, window_time, task_count):
         """Record tasks executed in a window"""
-        tasks = self.get_window_tasks()
-        tasks[window_time] = task_count
-        self.save_window_tasks(tasks)
+        with self._write_lock:
+            tasks = self.get_window_tasks()
+            tasks[window_time] = task_count
+            self.save_window_tasks(tasks)
         
     def get_tasks_in_window(self, window_time):
         """Get number of tasks executed in a window"""
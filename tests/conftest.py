@@ -0,0 +1,12 @@
+import pytest
+from unittest.mock import MagicMock
+
+@pytest.fixture
+def mock_driver():
+    """WebDriver stub that only matches the '//test' xpath"""
+    driver = MagicMock()
+    element = MagicMock()
+    driver.find_elements.side_effect = (
+        lambda by, xpath: [element] if xpath == "//test" else []
+    )
+    return driver
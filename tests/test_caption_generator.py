@@ -0,0 +1,26 @@
+import os
+
+from src.caption_generator import CaptionGenerator, IMAGE_EXTS, VIDEO_EXTS
+
+
+def test_process_directory_classifies_media(tmp_path, monkeypatch):
+    """Files are routed to the image/video pipelines by extension"""
+    for name in ("a.jpg", "b.PNG", "c.mp4", "notes.txt"):
+        (tmp_path / name).write_bytes(b"")
+
+    seen = {}
+    generator = CaptionGenerator()
+    monkeypatch.setattr(generator, "_caption_images_pipelined",
+                        lambda paths: iter(seen.setdefault("images", paths) and []))
+    monkeypatch.setattr(generator, "_caption_videos_pipelined",
+                        lambda paths: iter(seen.setdefault("videos", paths) and []))
+
+    assert list(generator.process_directory(str(tmp_path))) == []
+    assert sorted(os.path.basename(p) for p in seen["images"]) == ["a.jpg", "b.PNG"]
+    assert [os.path.basename(p) for p in seen["videos"]] == ["c.mp4"]
+
+
+def test_extension_sets_cover_common_media():
+    assert ".jpeg" in IMAGE_EXTS
+    assert ".mov" in VIDEO_EXTS
+    assert not (IMAGE_EXTS & VIDEO_EXTS)